@@ -3,15 +3,19 @@ Main script for analyzing ChatGPT conversations.
 """
 
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
+import pandas as pd
 from .parser import (
-    parse_chatgpt_conversations, 
-    analyze_conversations, 
-    plot_chat_frequency, 
+    parse_chatgpt_conversations,
+    analyze_conversations,
+    plot_chat_frequency,
     plot_message_frequency,
     plot_monthly_messages,
-    plot_model_usage
+    plot_model_usage,
+    week_start,
+    month_start
 )
 
 def create_output_directory() -> Path:
@@ -51,11 +55,18 @@ def save_analysis_results(analysis: dict, df, output_dir: Path) -> None:
             f.write(f"  Last Message: {last_date}\n")
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python -m chatgpt_analysis <path_to_conversations.json>")
+    args = sys.argv[1:]
+
+    # Opt into the polars parsing engine with --polars
+    use_polars = '--polars' in args
+    if use_polars:
+        args.remove('--polars')
+
+    if len(args) != 1:
+        print("Usage: python -m chatgpt_analysis <path_to_conversations.json> [--polars]")
         sys.exit(1)
-        
-    file_path = Path(sys.argv[1])
+
+    file_path = Path(args[0])
     if not file_path.exists():
         print(f"Error: File {file_path} does not exist")
         sys.exit(1)
@@ -66,7 +77,8 @@ def main():
         
     # Parse conversations
     print(f"Parsing conversations from {file_path}...")
-    df = parse_chatgpt_conversations(file_path)
+    df = parse_chatgpt_conversations(file_path,
+                                     engine='polars' if use_polars else 'pandas')
     
     # Analyze conversations
     print("Analyzing conversations...")
@@ -78,10 +90,25 @@ def main():
     
     # Create and save visualizations
     print("Generating visualizations...")
-    plot_chat_frequency(df, output_dir)
-    plot_message_frequency(df, output_dir)
-    plot_monthly_messages(df, output_dir)
-    plot_model_usage(df, output_dir)
+
+    # Filter out rows without timestamps and compute the week/month buckets
+    # once, so each plot doesn't redo the same datetime conversion
+    df_time = df.loc[df['create_time'].notna()].copy()
+    timestamps = pd.to_datetime(df_time['create_time'])
+    df_time['week_start'] = week_start(timestamps)
+    df_time['month'] = month_start(timestamps)
+
+    # Render the four plots in parallel worker processes. Matplotlib artists
+    # can't cross process boundaries, so each worker builds (and closes) its
+    # own Agg figure rather than sharing one Axes.
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(plot_fn, df_time, output_dir)
+            for plot_fn in (plot_chat_frequency, plot_message_frequency,
+                            plot_monthly_messages, plot_model_usage)
+        ]
+        for future in futures:
+            future.result()  # Propagate any plotting errors
     
     print(f"\nAnalysis complete! Results saved to: {output_dir}")
     print(f"- Text results: {output_dir}/analysis_results.txt")
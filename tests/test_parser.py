@@ -0,0 +1,41 @@
+"""
+Tests for chatgpt_analysis.parser.
+"""
+
+import json
+
+from chatgpt_analysis.parser import parse_chatgpt_conversations
+
+
+def _write_export(tmp_path, conversations):
+    path = tmp_path / 'conversations.json'
+    path.write_text(json.dumps(conversations))
+    return path
+
+
+def test_fractional_timestamps_survive_parsing(tmp_path):
+    # Real ChatGPT exports use fractional epoch floats for create_time; the
+    # ijson streaming path must not turn them into Decimals that
+    # pd.to_datetime coerces to NaT
+    path = _write_export(tmp_path, [{
+        'title': 'Test conversation',
+        'conversation_id': 'conv-1',
+        'mapping': {
+            'msg-1': {
+                'parent': None,
+                'message': {
+                    'create_time': 1672012800.5,
+                    'author': {'role': 'user'},
+                    'content': {'parts': ['hello']},
+                    'status': 'finished_successfully',
+                    'metadata': {}
+                }
+            }
+        }
+    }])
+
+    df = parse_chatgpt_conversations(path)
+
+    assert len(df) == 1
+    assert df['create_time'].notna().all()
+    assert df['create_time'].iloc[0].timestamp() == 1672012800.5